@@ -91,6 +91,9 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 
 s3 = boto3.client('s3')
 
+# Length of the chunk prefix stripped from S3_FILE_KEY
+_TEMP_PREFIX_LEN = len("temp/")
+
 def download_file_from_s3(bucket_name, file_base_name, file_key, local_path, folder_prefix=''):
     """
     Download a file from an S3 bucket.
@@ -653,7 +656,7 @@ def main():
             sys.exit(1)
         
         # Strip "temp/" and folder_prefix from the S3 key to get {basename}/{chunk}
-        remainder = s3_file_key[len("temp/") + len(folder_prefix):]
+        remainder = s3_file_key[_TEMP_PREFIX_LEN + len(folder_prefix):]
         parts = remainder.split('/')
         file_base_name = parts[0]  # basename
         file_key = parts[1]        # chunk filename
@@ -22,6 +22,29 @@ stepfunctions = boto3.client('stepfunctions')
 
 state_machine_arn = os.environ['STATE_MACHINE_ARN']
 
+# Length of the upload prefix stripped from incoming S3 keys
+_PDF_PREFIX_LEN = len("pdf/")
+
+def split_pdf_key(s3_key):
+    """
+    Splits an S3 key under 'pdf/' into its folder prefix and file basename.
+
+    Both values come from a single right-partition of the key, e.g.
+    "pdf/folder1/folder2/myfile.pdf" -> ("folder1/folder2/", "myfile") and
+    "pdf/myfile.pdf" -> ("", "myfile").
+
+    Parameters:
+        s3_key (str): The S3 key of the uploaded PDF, starting with 'pdf/'.
+
+    Returns:
+        tuple: (folder_prefix, file_basename), where folder_prefix is empty or ends with '/'.
+    """
+    head, _, tail = s3_key.rpartition('/')
+    stem, dot, _ = tail.rpartition('.')
+    file_basename = stem if dot else tail
+    folder_prefix = head[_PDF_PREFIX_LEN:] + '/' if head != "pdf" else ""
+    return folder_prefix, file_basename
+
 def log_chunk_created(filename):
     """
     Logs the creation of a PDF chunk.
@@ -68,16 +91,14 @@ def split_pdf_into_pages(source_content, original_key, s3_client, bucket_name, p
     num_pages = len(reader.pages)
 
     # Extract folder_prefix and file_basename from the S3 key
-    # e.g., "pdf/folder1/folder2/myfile.pdf" -> relative_path = "folder1/folder2/myfile.pdf"
-    relative_path = original_key[len("pdf/"):]
-    file_basename = relative_path.rsplit('/', 1)[-1].rsplit('.', 1)[0]
-    if '/' in relative_path:
-        folder_prefix = relative_path.rsplit('/', 1)[0] + '/'
-    else:
-        folder_prefix = ""
+    # e.g., "pdf/folder1/folder2/myfile.pdf" -> ("folder1/folder2/", "myfile")
+    folder_prefix, file_basename = split_pdf_key(original_key)
     
     chunks = []
 
+    # Every chunk of this PDF is uploaded under the same temp/ folder
+    chunk_folder = f"temp/{folder_prefix}{file_basename}/"
+
     # Iterate through the PDF pages in chunks
     for start in range(0, num_pages, pages_per_chunk):
         output = io.BytesIO()
@@ -93,7 +114,7 @@ def split_pdf_into_pages(source_content, original_key, s3_client, bucket_name, p
         # Create the filename and S3 key for this chunk
         chunk_index = start // pages_per_chunk + 1
         page_filename = f"{file_basename}_chunk_{chunk_index}.pdf"
-        s3_key = f"temp/{folder_prefix}{file_basename}/{page_filename}"
+        s3_key = chunk_folder + page_filename
 
         # Upload the chunk to S3
         s3_client.upload_fileobj(
@@ -141,12 +162,7 @@ def lambda_handler(event, context):
         else:
             raise ValueError("Event does not contain 'Records'. Check the S3 event structure.")
         # Extract folder_prefix and file_basename from the S3 key
-        relative_path = pdf_file_key[len("pdf/"):]
-        file_basename = relative_path.rsplit('/', 1)[-1].rsplit('.', 1)[0]
-        if '/' in relative_path:
-            folder_prefix = relative_path.rsplit('/', 1)[0] + '/'
-        else:
-            folder_prefix = ""
+        folder_prefix, file_basename = split_pdf_key(pdf_file_key)
 
 
         s3 = boto3.client('s3')
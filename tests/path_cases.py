@@ -0,0 +1,129 @@
+"""
+Shared cases for the folder-upload-support path construction tests.
+
+The tests in test_path_construction.py check pure string formatting, so they
+run as plain parametrized tests over a table of cases. A small hand-picked
+corpus covers the edge cases most likely to break: empty prefix, deep nesting,
+maximum segment lengths, spaces, non-ASCII characters, dotted basenames and
+names that collide with pipeline keywords.
+
+The hand-picked corpus is extended with a table drawn once from Hypothesis
+strategies by regen_cases.py and checked in as generated_cases.json: 200 cases
+with distinct basenames and mostly distinct folder prefixes, replayed without
+paying Hypothesis' generation cost on every run.
+
+Every case is expanded once into a SimpleNamespace holding the S3 key and
+every expected path, so the tests compare against ready-made fields instead of
+re-formatting the same strings in each method.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+
+# ---------------------------------------------------------------------------
+# Case corpus
+# ---------------------------------------------------------------------------
+
+# (folder_prefix, basename, chunk_index). Folder segments are at most 20
+# characters and 5 levels deep, basenames at most 30 characters, chunk
+# indices 1..1000 — the same shapes the upload path accepts.
+CASES = [
+    ("", "myfile", 1),
+    ("", "a", 1),
+    ("", "123", 100),
+    ("", "name with space", 42),
+    ("", "trailing space ", 8),
+    ("a/", "myfile", 1),
+    ("0/", "0", 1),
+    ("folder1/", "myfile", 2),
+    ("folder1/folder2/", "myfile", 10),
+    ("a/b/c/", "x", 1000),
+    ("a/b/c/d/e/", "deep", 7),
+    ("2024-reports/", "Q1_summary", 3),
+    ("UPPER/lower/", "MixedCase", 12),
+    ("folder-with-hyphens/", "file-with-hyphens", 5),
+    ("x_y-z/", "A-b_C", 999),
+    ("données/", "résumé final", 6),
+    ("docs/", "report_chunk_1", 1),
+    ("", "report.v2", 4),
+    ("archive/2024/", "scan.final.draft", 11),
+    ("pdf/", "temp", 2),
+    ("temp/output_autotag/", "COMPLIANT_file", 3),
+    ("a" * 20 + "/", "b" * 30, 1000),
+    ("/".join(["s" * 20] * 5) + "/", "n" * 29 + " ", 500),
+]
+
+
+# Written by regen_cases.py; one [folder_prefix, basename, chunk_index] per line.
+GENERATED_CASES_PATH = Path(__file__).with_name("generated_cases.json")
+
+
+def load_generated_cases() -> list:
+    """
+    Load the checked-in generated case table.
+
+    Raises:
+        FileNotFoundError: If generated_cases.json is missing. It is not rebuilt
+            here, since that needs hypothesis and would write into the source tree
+            during collection.
+    """
+    if not GENERATED_CASES_PATH.exists():
+        raise FileNotFoundError(
+            f"{GENERATED_CASES_PATH} is missing. Rebuild it with "
+            "`cd tests && python -m regen_cases` (requires hypothesis)."
+        )
+
+    with GENERATED_CASES_PATH.open(encoding="utf-8") as f:
+        return [tuple(case) for case in json.load(f)]
+
+
+ALL_CASES = CASES + [case for case in load_generated_cases() if case not in CASES]
+
+
+def pdf_case(folder_prefix: str, basename: str, chunk_index: int) -> SimpleNamespace:
+    """
+    Expand a case into an uploaded PDF key and the chunk path the splitter should derive.
+
+    Fields: folder_prefix, basename, chunk_index, s3_key
+    ('pdf/{folder_prefix}{basename}.pdf') and chunk_path
+    ('temp/{folder_prefix}{basename}/{basename}_chunk_{chunk_index}.pdf').
+    """
+    return SimpleNamespace(
+        folder_prefix=folder_prefix,
+        basename=basename,
+        chunk_index=chunk_index,
+        s3_key=f"pdf/{folder_prefix}{basename}.pdf",
+        chunk_path=f"temp/{folder_prefix}{basename}/{basename}_chunk_{chunk_index}.pdf",
+    )
+
+
+def s3_case(folder_prefix: str, basename: str, chunk_index: int) -> SimpleNamespace:
+    """
+    Expand a case into a chunk key under temp/ and the paths the Adobe Autotag container should build.
+
+    Fields: folder_prefix, basename, chunk_index, chunk_filename, s3_file_key,
+    download_path, upload_path and folder_autotag.
+    """
+    chunk_filename = f"{basename}_chunk_{chunk_index}.pdf"
+    s3_file_key = f"temp/{folder_prefix}{basename}/{chunk_filename}"
+    return SimpleNamespace(
+        folder_prefix=folder_prefix,
+        basename=basename,
+        chunk_index=chunk_index,
+        chunk_filename=chunk_filename,
+        s3_file_key=s3_file_key,
+        download_path=s3_file_key,
+        upload_path=f"temp/{folder_prefix}{basename}/output_autotag/COMPLIANT_{chunk_filename}",
+        folder_autotag=f"temp/{folder_prefix}{basename}/output_autotag",
+    )
+
+
+def case_id(case: SimpleNamespace) -> str:
+    """Readable pytest id for an expanded case, e.g. 'folder1/myfile-2'."""
+    return f"{case.folder_prefix}{case.basename}-{case.chunk_index}"
+
+
+PDF_CASES = [pdf_case(*case) for case in ALL_CASES]
+S3_CASES = [s3_case(*case) for case in ALL_CASES]
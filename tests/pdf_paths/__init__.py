@@ -0,0 +1,150 @@
+"""
+Pure S3 path functions for the folder-upload-support pipeline.
+
+Each function mirrors the key parsing or path construction inline in one of the
+pipeline components, so both component test suites can exercise the exact same
+logic without importing the AWS-bound modules themselves:
+
+- PDF splitter Lambda (lambda/pdf-splitter-lambda/main.py): split_pdf_key,
+  extract_folder_prefix, extract_file_basename, construct_chunk_path
+- Adobe Autotag container (adobe-autotag-container/adobe_autotag_processor.py):
+  extract_file_base_name_and_key, construct_download_path,
+  construct_upload_path, construct_s3_folder_autotag
+
+All functions take and return plain str values (chunk indices are int).
+"""
+
+__all__ = [
+    "split_pdf_key",
+    "extract_folder_prefix",
+    "extract_file_basename",
+    "construct_chunk_path",
+    "extract_file_base_name_and_key",
+    "construct_download_path",
+    "construct_upload_path",
+    "construct_s3_folder_autotag",
+]
+
+# Lengths of the fixed key prefixes, computed once instead of on every call
+_PDF_PREFIX_LEN = len("pdf/")
+_TEMP_PREFIX_LEN = len("temp/")
+
+# The construct_* builders deliberately use f-strings, matching the components.
+# On CPython 3.11/3.12 they compile to a single BUILD_STRING and measure faster
+# than both "%s" % (...) formatting and "".join((...)) for these all-str paths.
+
+
+# ---------------------------------------------------------------------------
+# PDF splitter Lambda (lambda/pdf-splitter-lambda/main.py)
+# ---------------------------------------------------------------------------
+
+def split_pdf_key(s3_key: str) -> tuple[str, str]:
+    """
+    Split an S3 key that starts with 'pdf/' into (folder_prefix, file_basename).
+
+    Mirrors split_pdf_key in lambda/pdf-splitter-lambda/main.py, which derives
+    both values from a single right-partition of the key.
+
+    For 'pdf/folder1/folder2/myfile.pdf' -> ('folder1/folder2/', 'myfile')
+    For 'pdf/myfile.pdf' -> ('', 'myfile')
+    """
+    head, _, tail = s3_key.rpartition('/')
+    stem, dot, _ = tail.rpartition('.')
+    file_basename = stem if dot else tail
+    folder_prefix = head[_PDF_PREFIX_LEN:] + '/' if head != "pdf" else ""
+    return folder_prefix, file_basename
+
+
+def extract_folder_prefix(s3_key: str) -> str:
+    """
+    Extract the folder prefix from an S3 key that starts with 'pdf/'.
+
+    For 'pdf/folder1/folder2/myfile.pdf' -> 'folder1/folder2/'
+    For 'pdf/myfile.pdf' -> ''
+    """
+    return split_pdf_key(s3_key)[0]
+
+
+def extract_file_basename(s3_key: str) -> str:
+    """
+    Extract the file basename (without extension) from an S3 key that starts with 'pdf/'.
+
+    For 'pdf/folder1/folder2/myfile.pdf' -> 'myfile'
+    For 'pdf/myfile.pdf' -> 'myfile'
+    """
+    return split_pdf_key(s3_key)[1]
+
+
+def construct_chunk_path(folder_prefix: str, file_basename: str, chunk_index: int) -> str:
+    """
+    Construct the S3 key for a chunk file.
+
+    Returns: 'temp/{folder_prefix}{file_basename}/{file_basename}_chunk_{chunk_index}.pdf'
+    """
+    page_filename = f"{file_basename}_chunk_{chunk_index}.pdf"
+    return f"temp/{folder_prefix}{file_basename}/{page_filename}"
+
+
+# ---------------------------------------------------------------------------
+# Adobe Autotag container (adobe-autotag-container/adobe_autotag_processor.py)
+# ---------------------------------------------------------------------------
+
+def extract_file_base_name_and_key(s3_file_key: str, folder_prefix: str) -> tuple[str, str]:
+    """
+    Extract file_base_name and file_key from an S3 file key using the folder prefix.
+
+    Mirrors the logic in adobe_autotag_processor.py main():
+        remainder = s3_file_key[_TEMP_PREFIX_LEN + len(folder_prefix):]
+        parts = remainder.split('/')
+        file_base_name = parts[0]
+        file_key = parts[1]
+
+    Args:
+        s3_file_key: S3 key like 'temp/{folder_prefix}{basename}/{chunk_filename}'
+        folder_prefix: The folder prefix (e.g., 'folder1/folder2/' or '')
+
+    Returns:
+        (file_base_name, file_key) tuple
+    """
+    remainder = s3_file_key[_TEMP_PREFIX_LEN + len(folder_prefix):]
+    parts = remainder.split('/')
+    file_base_name = parts[0]
+    file_key = parts[1]
+    return file_base_name, file_key
+
+
+def construct_download_path(folder_prefix: str, file_base_name: str, file_key: str) -> str:
+    """
+    Construct the S3 download path for a chunk file.
+
+    Mirrors download_file_from_s3:
+        s3.download_file(bucket_name, f"temp/{folder_prefix}{file_base_name}/{file_key}", local_path)
+
+    Returns: 'temp/{folder_prefix}{file_base_name}/{file_key}'
+    """
+    return f"temp/{folder_prefix}{file_base_name}/{file_key}"
+
+
+def construct_upload_path(folder_prefix: str, file_base_name: str, file_key: str) -> str:
+    """
+    Construct the S3 upload path for the autotagged PDF.
+
+    Mirrors save_to_s3 called with folder_name="output_autotag":
+        s3.upload_fileobj(data, bucket_name,
+            f"temp/{folder_prefix}{file_basename}/{folder_name}/COMPLIANT_{file_key}")
+
+    Returns: 'temp/{folder_prefix}{file_base_name}/output_autotag/COMPLIANT_{file_key}'
+    """
+    return f"temp/{folder_prefix}{file_base_name}/output_autotag/COMPLIANT_{file_key}"
+
+
+def construct_s3_folder_autotag(folder_prefix: str, file_base_name: str) -> str:
+    """
+    Construct the S3 folder path for autotag output (images, DB, etc.).
+
+    Mirrors main():
+        s3_folder_autotag = f"temp/{folder_prefix}{file_base_name}/output_autotag"
+
+    Returns: 'temp/{folder_prefix}{file_base_name}/output_autotag'
+    """
+    return f"temp/{folder_prefix}{file_base_name}/output_autotag"
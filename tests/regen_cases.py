@@ -0,0 +1,126 @@
+"""
+Regenerate the generated case table used by the folder-upload-support path tests.
+
+The path tests replay a fixed table instead of running Hypothesis on every
+pytest invocation. This script draws that table once from Hypothesis strategies
+and writes it to generated_cases.json next to this file, which is checked in.
+Run it again whenever the shape of the cases changes:
+
+    cd tests && python -m regen_cases
+
+Generation is derandomized, so repeated runs with the same Hypothesis version
+write the same table. The derandomized output changes between Hypothesis
+versions, and Hypothesis is not pinned in this repo. Regenerating with a
+different version therefore rewrites the table: review that diff like any other
+change. The checked-in table was generated with hypothesis 6.169.0.
+"""
+
+import json
+import string
+from pathlib import Path
+
+from hypothesis import HealthCheck, Phase, given, settings
+from hypothesis import strategies as st
+
+
+GENERATED_CASES_PATH = Path(__file__).with_name("generated_cases.json")
+
+NUM_CASES = 200
+
+# Examples drawn per kept case; most draws are discarded as near-duplicates
+DRAWS_PER_CASE = 20
+
+
+# ---------------------------------------------------------------------------
+# Hypothesis strategies
+# ---------------------------------------------------------------------------
+
+_ALNUM = string.ascii_letters + string.digits
+
+
+def _name_st(tail_alphabet: str, max_size: int):
+    """
+    Build names of 1..max_size characters that start with an alphanumeric.
+
+    Equivalent to st.from_regex(r"[a-zA-Z0-9][<tail_alphabet>]{0,max_size-1}"),
+    without running the regex-to-strategy compiler on every draw.
+    """
+    return st.builds(
+        lambda head, tail: head + tail,
+        st.sampled_from(_ALNUM),
+        st.text(alphabet=tail_alphabet, min_size=0, max_size=max_size - 1),
+    )
+
+
+# Strategy for valid folder segment names: non-empty, no slashes, no dots at start,
+# alphanumeric with hyphens and underscores (realistic S3 folder names)
+folder_segment_st = _name_st(_ALNUM + "_-", max_size=20)
+
+# Strategy for folder structures: 0 to 5 levels deep
+folder_prefix_st = st.lists(folder_segment_st, min_size=0, max_size=5).map(
+    lambda parts: "/".join(parts) + "/" if parts else ""
+)
+
+# Strategy for valid basenames: non-empty, no slashes, no dots (extension added separately)
+basename_st = _name_st(_ALNUM + "_- ", max_size=30)
+
+# Strategy for chunk indices (1-based)
+chunk_index_st = st.integers(min_value=1, max_value=1000)
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+def generate_cases(num_cases: int = NUM_CASES) -> list:
+    """
+    Draw up to num_cases varied (folder_prefix, basename, chunk_index) cases.
+
+    Hypothesis tends to emit runs of small mutations of one example, so a case
+    is kept only if both its basename and its folder prefix are new (the empty
+    prefix is exempt). Many more examples are drawn than kept, so the table
+    still fills up.
+
+    Generation is derandomized, so repeated runs with the same Hypothesis version
+    draw the same cases. Only the generate phase runs: there is no test to fail,
+    so shrinking, health checks and the example database would be pure overhead.
+    """
+    cases = []
+    seen_basenames = set()
+    seen_prefixes = set()
+
+    @given(folder_prefix=folder_prefix_st, basename=basename_st, chunk_index=chunk_index_st)
+    @settings(
+        max_examples=num_cases * DRAWS_PER_CASE,
+        derandomize=True,
+        database=None,
+        deadline=None,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+    )
+    def collect(folder_prefix: str, basename: str, chunk_index: int):
+        if len(cases) >= num_cases or basename in seen_basenames or folder_prefix in seen_prefixes:
+            return
+        seen_basenames.add(basename)
+        if folder_prefix:
+            seen_prefixes.add(folder_prefix)
+        cases.append((folder_prefix, basename, chunk_index))
+
+    collect()
+    return cases
+
+
+def write_cases(cases: list, path: Path = GENERATED_CASES_PATH) -> None:
+    """Write cases as a JSON array with one case per line, so diffs stay readable."""
+    lines = ",\n".join("  " + json.dumps(list(case)) for case in cases)
+    path.write_text("[\n" + lines + "\n]\n", encoding="utf-8")
+
+
+def main():
+    cases = generate_cases()
+    write_cases(cases)
+    print(f"Wrote {len(cases)} cases to {GENERATED_CASES_PATH}")
+
+
+if __name__ == "__main__":
+    main()
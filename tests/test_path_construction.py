@@ -0,0 +1,238 @@
+"""
+Table-driven tests for folder-upload-support path construction.
+
+Feature: folder-upload-support
+  Property 1: Folder prefix extraction and chunk path construction
+  Property 2: Adobe Autotag path construction
+
+**Validates: Requirements 1.1, 1.2, 1.4, 2.2, 2.4, 7.1, 7.2**
+
+Uses pytest with the shared table of cases from path_cases.py to verify that:
+
+- For any valid S3 key of the form `pdf/{arbitrary_folders}/{filename}.pdf`
+  (including zero folders), the PDF splitter extracts the folder prefix and file
+  basename and constructs chunk paths as
+  `temp/{folder_prefix}{basename}/{basename}_chunk_N.pdf`.
+- For any folder prefix (including empty string) and S3 file key of the form
+  `temp/{folder_prefix}{basename}/{chunk_filename}`, the Adobe Autotag container
+  extracts the correct `file_base_name` and `file_key`, and constructs download
+  paths as `temp/{folder_prefix}{file_base_name}/{file_key}` and upload paths as
+  `temp/{folder_prefix}{file_base_name}/output_autotag/COMPLIANT_{file_key}`.
+
+`adobe-autotag-container/test_folder_prefix.py` and
+`lambda/pdf-splitter-lambda/test_folder_prefix.py` re-export the component
+classes below, so running pytest from either component directory still picks
+them up. A run that selects both tests/ and a component directory runs that
+component's class twice.
+"""
+
+import pytest
+
+from path_cases import PDF_CASES, S3_CASES, case_id, pdf_case
+from pdf_paths import (
+    construct_chunk_path,
+    construct_download_path,
+    construct_s3_folder_autotag,
+    construct_upload_path,
+    extract_file_base_name_and_key,
+    extract_file_basename,
+    extract_folder_prefix,
+    split_pdf_key,
+)
+
+NO_FOLDER_CASES = [case for case in PDF_CASES if not case.folder_prefix]
+
+INVARIANT_SAMPLE = [
+    pdf_case("", "myfile", 1),
+    pdf_case("folder1/folder2/", "myfile", 10),
+    pdf_case("a/b/c/d/e/", "deep", 7),
+    pdf_case("pdf/", "temp", 2),
+    pdf_case("données/", "résumé final", 6),
+]
+
+
+# ---------------------------------------------------------------------------
+# PDF splitter Lambda
+# ---------------------------------------------------------------------------
+
+class TestFolderPrefixExtraction:
+    """
+    Property 1: Folder prefix extraction and chunk path construction.
+
+    **Validates: Requirements 1.1, 1.2, 1.4, 7.1, 7.2**
+    """
+
+    @pytest.mark.parametrize("case", PDF_CASES, ids=case_id)
+    def test_folder_prefix_extraction_roundtrip(self, case):
+        """
+        For any valid S3 key pdf/{folders}/{filename}.pdf, extracting the folder
+        prefix SHALL return the path between pdf/ and the filename, with a trailing
+        slash if non-empty.
+
+        **Validates: Requirements 1.1, 1.2**
+        """
+        extracted = extract_folder_prefix(case.s3_key)
+        assert extracted == case.folder_prefix
+
+    @pytest.mark.parametrize("case", PDF_CASES, ids=case_id)
+    def test_file_basename_extraction(self, case):
+        """
+        For any valid S3 key, extracting the file basename SHALL return the
+        filename without extension.
+
+        **Validates: Requirements 1.1, 1.2**
+        """
+        extracted = extract_file_basename(case.s3_key)
+        assert extracted == case.basename
+
+    @pytest.mark.parametrize("case", PDF_CASES, ids=case_id)
+    def test_chunk_path_construction(self, case):
+        """
+        For any valid folder prefix, basename, and chunk index, constructing the
+        chunk path SHALL produce temp/{folder_prefix}{basename}/{basename}_chunk_N.pdf.
+
+        **Validates: Requirements 1.4, 7.2**
+        """
+        chunk_path = construct_chunk_path(case.folder_prefix, case.basename, case.chunk_index)
+        assert chunk_path == case.chunk_path
+
+    @pytest.mark.parametrize("case", PDF_CASES, ids=case_id)
+    def test_end_to_end_extraction_and_construction(self, case):
+        """
+        End-to-end property: for any valid S3 key, extracting the folder prefix
+        and basename, then constructing the chunk path, SHALL produce the correct
+        temp/{folder_prefix}{basename}/{basename}_chunk_N.pdf path.
+
+        This is the full Property 1 from the design document.
+
+        **Validates: Requirements 1.1, 1.2, 1.4, 7.1, 7.2**
+        """
+        # Extract
+        extracted_prefix, extracted_basename = split_pdf_key(case.s3_key)
+
+        # Construct
+        chunk_path = construct_chunk_path(extracted_prefix, extracted_basename, case.chunk_index)
+
+        # Verify
+        if chunk_path != case.chunk_path:
+            pytest.fail(
+                f"For S3 key '{case.s3_key}' with chunk_index={case.chunk_index}:\n"
+                f"  Expected: '{case.chunk_path}'\n"
+                f"  Got:      '{chunk_path}'"
+            )
+
+    @pytest.mark.parametrize("case", NO_FOLDER_CASES, ids=case_id)
+    def test_backward_compatibility_no_folder(self, case):
+        """
+        When a PDF is uploaded directly to pdf/{basename}.pdf (no folder),
+        the folder prefix SHALL be empty and the chunk path SHALL be
+        temp/{basename}/{basename}_chunk_N.pdf — identical to current behavior.
+
+        **Validates: Requirements 7.1, 7.2**
+        """
+        extracted_prefix = extract_folder_prefix(case.s3_key)
+        extracted_basename = extract_file_basename(case.s3_key)
+
+        assert extracted_prefix == ""
+        assert extracted_basename == case.basename
+
+        chunk_path = construct_chunk_path(extracted_prefix, extracted_basename, case.chunk_index)
+        assert chunk_path == case.chunk_path
+
+    def test_invariants_on_sample(self):
+        """
+        For a fixed sample of keys, the extracted folder prefix SHALL be empty or
+        end with a trailing slash, and every chunk path SHALL start with 'temp/'
+        and end with '.pdf'.
+
+        These invariants follow from the end-to-end property above; this sample
+        keeps them as explicit regression checks.
+
+        **Validates: Requirements 1.1, 1.2, 1.4**
+        """
+        for case in INVARIANT_SAMPLE:
+            extracted_prefix, extracted_basename = split_pdf_key(case.s3_key)
+            assert extracted_prefix == "" or extracted_prefix.endswith("/")
+
+            chunk_path = construct_chunk_path(extracted_prefix, extracted_basename, case.chunk_index)
+            assert chunk_path.startswith("temp/")
+            assert chunk_path.endswith(".pdf")
+
+
+# ---------------------------------------------------------------------------
+# Adobe Autotag container
+# ---------------------------------------------------------------------------
+
+class TestAdobeAutotagPathConstruction:
+    """
+    Property 2: Adobe Autotag path construction.
+
+    **Validates: Requirements 2.2, 2.4**
+    """
+
+    @pytest.mark.parametrize("case", S3_CASES, ids=case_id)
+    def test_all_properties(self, case):
+        """
+        For any folder prefix (including empty string) and S3 file key of the form
+        temp/{folder_prefix}{basename}/{chunk_filename}, the Adobe Autotag container
+        SHALL extract the correct file_base_name and file_key, and construct download
+        paths as temp/{folder_prefix}{file_base_name}/{file_key} and upload paths as
+        temp/{folder_prefix}{file_base_name}/output_autotag/COMPLIANT_{file_key}.
+
+        Every Property 2 assertion runs against a single extraction per case.
+
+        **Validates: Requirements 2.2, 2.4**
+        """
+        folder_prefix = case.folder_prefix
+
+        # Extract (mirrors main() logic)
+        file_base_name, file_key = extract_file_base_name_and_key(case.s3_file_key, folder_prefix)
+
+        # Extraction recovers the original basename and chunk filename
+        assert file_base_name == case.basename
+        assert file_key == case.chunk_filename
+
+        # Download path round-trips to the original S3 key
+        download_path = construct_download_path(folder_prefix, file_base_name, file_key)
+        assert download_path == case.s3_file_key
+
+        # Upload path
+        upload_path = construct_upload_path(folder_prefix, file_base_name, file_key)
+        assert upload_path == case.upload_path
+
+        # s3_folder_autotag
+        folder_autotag = construct_s3_folder_autotag(folder_prefix, file_base_name)
+        assert folder_autotag == case.folder_autotag
+
+    @pytest.mark.parametrize(
+        "basename, chunk_index",
+        [
+            ("myfile", 1),
+            ("report_2024", 17),
+            ("name with spaces", 200),
+            ("A-b_C", 1000),
+        ],
+    )
+    def test_backward_compatibility_empty_prefix(self, basename: str, chunk_index: int):
+        """
+        When the folder prefix is empty, all paths SHALL be identical to the
+        current behavior (no folder prefix in paths).
+
+        **Validates: Requirements 2.4**
+        """
+        chunk_filename = f"{basename}_chunk_{chunk_index}.pdf"
+        s3_file_key = f"temp/{basename}/{chunk_filename}"
+
+        file_base_name, file_key = extract_file_base_name_and_key(s3_file_key, "")
+
+        # Download path should be temp/{basename}/{chunk} (no folder prefix)
+        download_path = construct_download_path("", file_base_name, file_key)
+        assert download_path == s3_file_key
+
+        # Upload path should be temp/{basename}/output_autotag/COMPLIANT_{chunk}
+        upload_path = construct_upload_path("", file_base_name, file_key)
+        assert upload_path == f"temp/{basename}/output_autotag/COMPLIANT_{chunk_filename}"
+
+        # s3_folder_autotag should be temp/{basename}/output_autotag
+        folder_autotag = construct_s3_folder_autotag("", file_base_name)
+        assert folder_autotag == f"temp/{basename}/output_autotag"